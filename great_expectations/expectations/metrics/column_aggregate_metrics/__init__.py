@@ -15,3 +15,6 @@ from .column_standard_deviation import ColumnStandardDeviation
 from .column_sum import ColumnSum
 from .column_value_counts import ColumnValueCounts
 from .column_values_between_count import ColumnValuesBetweenCount
+from .column_values_match_strftime_format_multi import (
+    ColumnValuesMatchStrftimeFormatMultiUnexpectedCounts,
+)
@@ -0,0 +1,53 @@
+from typing import List, Optional, Pattern
+
+import numpy as np
+
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
+    ColumnAggregateMetricProvider,
+    column_aggregate_value,
+)
+from great_expectations.expectations.metrics.column_map_metrics.column_values_match_strftime_format import (
+    get_strftime_format_regex,
+    is_parseable_by_strftime_format,
+)
+
+
+class ColumnValuesMatchStrftimeFormatMultiUnexpectedCounts(
+    ColumnAggregateMetricProvider
+):
+    """
+    This metric is an aggregate helper for detecting date formats.
+
+    It computes the "column_values.match_strftime_format.unexpected_count" metric for every one of "strftime_formats"
+    in a single pass over the column (rather than one pass per format) and returns the list of unexpected counts, whose
+    elements correspond to "strftime_formats" (in the same order).  Null values are not counted (as with map metrics).
+    Counts are returned as an int64 array (regardless of the number of values in the column).
+    """
+
+    metric_name = "column_values.match_strftime_format_multi.unexpected_counts"
+    value_keys = ("strftime_formats",)
+    filter_column_isnull = True
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, strftime_formats, **kwargs):
+        strftime_format: str
+        format_regexes: List[Optional[Pattern]] = [
+            get_strftime_format_regex(strftime_format=strftime_format)
+            for strftime_format in strftime_formats
+        ]
+
+        unexpected_counts: List[int] = [0] * len(strftime_formats)
+
+        idx: int
+        format_regex: Optional[Pattern]
+        for val in column:
+            for idx, (strftime_format, format_regex) in enumerate(
+                zip(strftime_formats, format_regexes)
+            ):
+                if not is_parseable_by_strftime_format(
+                    val=val, strftime_format=strftime_format, format_regex=format_regex
+                ):
+                    unexpected_counts[idx] += 1
+
+        return np.asarray(unexpected_counts, dtype=np.int64)
@@ -1,4 +1,9 @@
+import _strptime
+import locale
+import time
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional, Pattern, Tuple
 
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
@@ -11,22 +16,79 @@ from great_expectations.expectations.metrics.map_metric_provider import (
 )
 
 
+def get_strftime_format_regex(strftime_format: str) -> Optional[Pattern]:
+    """
+    Returns the compiled regular expression, which "datetime.strptime()" matches values against for "strftime_format"
+    (in current locale), or None if "strftime_format" is invalid (in which case "datetime.strptime()" reports error).
+
+    Values, rejected by this regular expression, cannot be parsed; hence, calling "datetime.strptime()" on them (only to
+    have it raise "ValueError", which is expensive) can be avoided.  Compiled expressions are computed once and cached
+    (as in "datetime.strptime()" itself, cache entries are specific to locale and time zone settings).
+    """
+    # Non-string "strftime_format" is left for "datetime.strptime()" to reject (with customary error message).
+    if not isinstance(strftime_format, str):
+        return None
+
+    return _get_strftime_format_regex(
+        strftime_format=strftime_format,
+        lang=locale.getlocale(locale.LC_TIME),
+        tzname=tuple(time.tzname),
+        daylight=time.daylight,
+    )
+
+
+@lru_cache(maxsize=256)
+def _get_strftime_format_regex(
+    strftime_format: str,
+    lang: Tuple[Optional[str], Optional[str]],
+    tzname: Tuple[str, ...],
+    daylight: int,
+) -> Optional[Pattern]:
+    try:
+        # The "_strptime.TimeRE" helper builds regular expressions for "datetime.strptime()" in the current locale.
+        return _strptime.TimeRE().compile(strftime_format)
+    except (IndexError, KeyError, ValueError):
+        # Invalid "strftime_format" (e.g., stray "%" or bad directive) is left for "datetime.strptime()" to reject.
+        return None
+
+
+def is_parseable_by_strftime_format(
+    val: Any, strftime_format: str, format_regex: Optional[Pattern] = None
+) -> bool:
+    """
+    Returns True if "val" can be parsed by "datetime.strptime()" using "strftime_format"; otherwise, returns False.
+    Optional "format_regex" (as returned by "get_strftime_format_regex()") rejects unparseable values without parsing.
+    """
+    if format_regex is not None and isinstance(val, str):
+        found = format_regex.match(val)
+        if found is None or found.end() != len(val):
+            return False
+
+    try:
+        datetime.strptime(val, strftime_format)
+        return True
+    except TypeError:
+        raise TypeError(
+            "Values passed to expect_column_values_to_match_strftime_format must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."
+        )
+    except ValueError:
+        return False
+
+
 class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
     condition_metric_name = "column_values.match_strftime_format"
     condition_value_keys = ("strftime_format",)
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, strftime_format, **kwargs):
+        format_regex: Optional[Pattern] = get_strftime_format_regex(
+            strftime_format=strftime_format
+        )
+
         def is_parseable_by_format(val):
-            try:
-                datetime.strptime(val, strftime_format)
-                return True
-            except TypeError:
-                raise TypeError(
-                    "Values passed to expect_column_values_to_match_strftime_format must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."
-                )
-            except ValueError:
-                return False
+            return is_parseable_by_strftime_format(
+                val=val, strftime_format=strftime_format, format_regex=format_regex
+            )
 
         return column.map(is_parseable_by_format)
 
@@ -243,6 +243,9 @@ class ParameterBuilder(Builder, ABC):
         ] = None,
         enforce_numeric_metric: Union[str, bool] = False,
         replace_nan_with_zero: Union[str, bool] = False,
+        return_matrix: bool = False,
+        batch_ids: Optional[List[str]] = None,
+        validator: Optional["Validator"] = None,  # noqa: F821
         domain: Optional[Domain] = None,
         variables: Optional[ParameterContainer] = None,
         parameters: Optional[Dict[str, ParameterContainer]] = None,
@@ -257,6 +260,14 @@ class ParameterBuilder(Builder, ABC):
         :param metric_value_kwargs: Metric Value Kwargs is an essential parameter of the MetricConfiguration object.
         :param enforce_numeric_metric: Flag controlling whether or not metric output must be numerically-valued.
         :param replace_nan_with_zero: Directive controlling how NaN metric values, if encountered, should be handled.
+        :param return_matrix: Flag directing that metric values for all "metric_value_kwargs" be returned as one array
+        in the format "M x N x R^m", where "M" is the number of "metric_value_kwargs" (in the same order), instead of
+        list of AttributedResolvedMetrics objects (for single "metric_value_kwargs", "M" is 1); "metric_value_kwargs" must
+        be distinct and must yield metric values of the same shape (otherwise, ProfilerExecutionError is raised).
+        :param batch_ids: IDs of Batch objects, for which metric is computed (from "get_batch_ids()", if omitted);
+        callers, computing metrics repeatedly, can pass them in order to avoid loading Batch objects every time.
+        :param validator: Validator object used for metric computation (from "get_validator()", if omitted); similarly,
+        callers, computing metrics repeatedly, can pass it in order to avoid creating Validator object every time.
         :param domain: Domain object scoping "$variable"/"$parameter"-style references in configuration and runtime.
         :param variables: Part of the "rule state" available for "$variable"-style references.
         :param parameters: Part of the "rule state" available for "$parameter"-style references.
@@ -264,13 +275,64 @@ class ParameterBuilder(Builder, ABC):
         significant dimension) is the number of measurements (e.g., one per Batch of data), while "R^m" is the
         multi-dimensional metric, whose values are being estimated, and details (to be used for metadata purposes).
         """
-        # IDs of Batch objects used to compute the metric -- commonly obtained via the "get_batch_ids()"
-        # method in this module, although it can readily accept the list of Batch IDs generated through any other means.
-        batch_ids: Optional[List[str]] = self.get_batch_ids(
+        return self.get_multiple_metrics(
+            metric_specifications=[
+                (
+                    metric_name,
+                    metric_value_kwargs,
+                ),
+            ],
+            metric_domain_kwargs=metric_domain_kwargs,
+            enforce_numeric_metric=enforce_numeric_metric,
+            replace_nan_with_zero=replace_nan_with_zero,
+            return_matrix=return_matrix,
+            batch_ids=batch_ids,
+            validator=validator,
             domain=domain,
             variables=variables,
             parameters=parameters,
-        )
+        )[0]
+
+    def get_multiple_metrics(
+        self,
+        metric_specifications: List[
+            Tuple[
+                str,
+                Optional[Union[Union[str, dict], List[Union[str, dict]]]],
+            ]
+        ],
+        metric_domain_kwargs: Optional[
+            Union[Union[str, dict], List[Union[str, dict]]]
+        ] = None,
+        enforce_numeric_metric: Union[str, bool] = False,
+        replace_nan_with_zero: Union[str, bool] = False,
+        return_matrix: bool = False,
+        batch_ids: Optional[List[str]] = None,
+        validator: Optional["Validator"] = None,  # noqa: F821
+        domain: Optional[Domain] = None,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricComputationResult]:
+        """
+        Multi-metric counterpart of "get_metrics()".
+
+        Computes several metrics over the same "metric_domain_kwargs" in one dispatch to the execution engine (rather
+        than one dispatch per metric), so that the execution engine can plan their computations together.
+        :param metric_specifications: List of ("metric_name", "metric_value_kwargs") pairs, each specifying metric of
+        interest (along with its Metric Value Kwargs, possibly multiple) exactly as in the "get_metrics()" method.
+        The remaining parameters are the same as those of the "get_metrics()" method and apply to all metrics.
+        :return: List of MetricComputationResult objects, one per element of "metric_specifications" (in same order),
+        each formatted exactly as the result of the "get_metrics()" method would be for the given metric.
+        """
+        # IDs of Batch objects used to compute the metric -- commonly obtained via the "get_batch_ids()"
+        # method in this module, although it can readily accept the list of Batch IDs generated through any other means.
+        if batch_ids is None:
+            batch_ids = self.get_batch_ids(
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
+
         if not batch_ids:
             raise ge_exceptions.ProfilerExecutionError(
                 message=f"Utilizing a {self.__class__.__name__} requires a non-empty list of batch identifiers."
@@ -311,57 +373,109 @@ class ParameterBuilder(Builder, ABC):
             for batch_id in batch_ids
         ]
 
-        # Second: Gather "metric_value_kwargs" (caller may require same metric computed for multiple arguments).
+        metric_name: str
+        metric_value_kwargs: Optional[Union[Union[str, dict], List[Union[str, dict]]]]
+        metric_value_kwargs_per_specification: List[List[dict]] = []
+        metrics_to_resolve_per_specification: List[List[MetricConfiguration]] = []
+        for metric_name, metric_value_kwargs in metric_specifications:
+            # Second: Gather "metric_value_kwargs" (caller may require same metric computed for multiple arguments).
 
-        if not isinstance(metric_value_kwargs, list):
-            metric_value_kwargs = [metric_value_kwargs]
+            if not isinstance(metric_value_kwargs, list):
+                metric_value_kwargs = [metric_value_kwargs]
 
-        value_kwargs_cursor: dict
-        metric_value_kwargs = [
-            # Obtain value kwargs from "rule state" (i.e., variables and parameters); from instance variable otherwise.
-            get_parameter_value_and_validate_return_type(
-                domain=domain,
-                parameter_reference=value_kwargs_cursor,
-                expected_return_type=None,
-                variables=variables,
-                parameters=parameters,
+            value_kwargs_cursor: dict
+            metric_value_kwargs = [
+                # Obtain value kwargs from "rule state" (i.e., variables and parameters); from instance variable otherwise.
+                get_parameter_value_and_validate_return_type(
+                    domain=domain,
+                    parameter_reference=value_kwargs_cursor,
+                    expected_return_type=None,
+                    variables=variables,
+                    parameters=parameters,
+                )
+                for value_kwargs_cursor in metric_value_kwargs
+            ]
+            metric_value_kwargs_per_specification.append(metric_value_kwargs)
+
+            # Third: Generate "MetricConfiguration" directives for all "metric_domain_kwargs" / "metric_value_kwargs" pairs.
+
+            domain_kwargs_cursor: dict
+            kwargs_combinations: List[List[dict]] = [
+                [domain_kwargs_cursor, value_kwargs_cursor]
+                for value_kwargs_cursor in metric_value_kwargs
+                for domain_kwargs_cursor in metric_domain_kwargs
+            ]
+
+            kwargs_pair_cursor: List[dict, dict]
+            metrics_to_resolve_per_specification.append(
+                [
+                    MetricConfiguration(
+                        metric_name=metric_name,
+                        metric_domain_kwargs=kwargs_pair_cursor[0],
+                        metric_value_kwargs=kwargs_pair_cursor[1],
+                        metric_dependencies=None,
+                    )
+                    for kwargs_pair_cursor in kwargs_combinations
+                ]
             )
-            for value_kwargs_cursor in metric_value_kwargs
-        ]
-
-        # Third: Generate "MetricConfiguration" directives for all "metric_domain_kwargs" / "metric_value_kwargs" pairs.
-
-        domain_kwargs_cursor: dict
-        kwargs_combinations: List[List[dict]] = [
-            [domain_kwargs_cursor, value_kwargs_cursor]
-            for value_kwargs_cursor in metric_value_kwargs
-            for domain_kwargs_cursor in metric_domain_kwargs
-        ]
 
-        kwargs_pair_cursor: List[dict, dict]
-        metrics_to_resolve: List[MetricConfiguration] = [
-            MetricConfiguration(
-                metric_name=metric_name,
-                metric_domain_kwargs=kwargs_pair_cursor[0],
-                metric_value_kwargs=kwargs_pair_cursor[1],
-                metric_dependencies=None,
-            )
-            for kwargs_pair_cursor in kwargs_combinations
-        ]
+        # Fourth: Resolve all metrics (of all "metric_specifications") in one operation simultaneously.
 
-        # Fourth: Resolve all metrics in one operation simultaneously.
+        metrics_to_resolve: List[MetricConfiguration] = list(
+            itertools.chain.from_iterable(metrics_to_resolve_per_specification)
+        )
 
         # The Validator object used for metric calculation purposes.
-        validator: "Validator" = self.get_validator(  # noqa: F821
-            domain=domain,
-            variables=variables,
-            parameters=parameters,
-        )
+        if validator is None:
+            validator = self.get_validator(
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
 
         resolved_metrics: Dict[Tuple[str, str, str], Any] = validator.compute_metrics(
             metric_configurations=metrics_to_resolve
         )
 
+        idx: int
+        return [
+            self._build_metric_computation_result(
+                metric_name=metric_specifications[idx][0],
+                domain_kwargs=domain_kwargs,
+                metric_value_kwargs=metric_value_kwargs_per_specification[idx],
+                metrics_to_resolve=metrics_to_resolve_per_specification[idx],
+                resolved_metrics=resolved_metrics,
+                batch_ids=batch_ids,
+                enforce_numeric_metric=enforce_numeric_metric,
+                replace_nan_with_zero=replace_nan_with_zero,
+                return_matrix=return_matrix,
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
+            for idx in range(len(metric_specifications))
+        ]
+
+    def _build_metric_computation_result(
+        self,
+        metric_name: str,
+        domain_kwargs: dict,
+        metric_value_kwargs: List[dict],
+        metrics_to_resolve: List[MetricConfiguration],
+        resolved_metrics: Dict[Tuple[str, str, str], Any],
+        batch_ids: List[str],
+        enforce_numeric_metric: Union[str, bool] = False,
+        replace_nan_with_zero: Union[str, bool] = False,
+        return_matrix: bool = False,
+        domain: Optional[Domain] = None,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> MetricComputationResult:
+        """
+        Assembles MetricComputationResult object for one metric from "resolved_metrics" (computation results of all
+        "MetricConfiguration" directives, resolved together) of its own "MetricConfiguration" directives.
+        """
+
         # Fifth: Map resolved metrics to their attributes for identification and recovery by receiver.
 
         metric_configuration: MetricConfiguration
@@ -428,12 +542,48 @@ class ParameterBuilder(Builder, ABC):
             )
 
         # Nineth: Compose and return result to receiver (apply simplications to cases of single "metric_value_kwargs").
-        return MetricComputationResult(
-            metric_values=list(attributed_resolved_metrics_map.values())[
+        computed_metric_values: MetricValues
+        if return_matrix:
+            # Duplicate "metric_value_kwargs" share one entry (keyed by ID); hence, "M" would not match their number.
+            if len(attributed_resolved_metrics_map) != len(metric_value_kwargs):
+                raise ge_exceptions.ProfilerExecutionError(
+                    message=f"""Utilizing "return_matrix" in {self.__class__.__name__} requires distinct \
+"metric_value_kwargs" for metric "{metric_name}" (duplicates were found).
+"""
+                )
+
+            # Metric values for all "metric_value_kwargs" must have the same shape ("N x R^m") in order to be stacked.
+            if (
+                len(
+                    {
+                        metric_values.metric_values.shape
+                        for metric_values in attributed_resolved_metrics_map.values()
+                    }
+                )
+                > 1
+            ):
+                raise ge_exceptions.ProfilerExecutionError(
+                    message=f"""Utilizing "return_matrix" in {self.__class__.__name__} requires metric "{metric_name}" \
+to have values of the same shape for all "metric_value_kwargs".
+"""
+                )
+
+            # Metric values for all "metric_value_kwargs" (in the same order) are stacked as "M x N x R^m" array.
+            computed_metric_values = np.stack(
+                [
+                    metric_values.metric_values
+                    for metric_values in attributed_resolved_metrics_map.values()
+                ]
+            )
+        elif len(metric_value_kwargs) == 1:
+            computed_metric_values = list(attributed_resolved_metrics_map.values())[
                 0
             ].metric_values
-            if len(metric_value_kwargs) == 1
-            else list(attributed_resolved_metrics_map.values()),
+        else:
+            computed_metric_values = list(attributed_resolved_metrics_map.values())
+
+        return MetricComputationResult(
+            metric_values=computed_metric_values,
             details={
                 "metric_configuration": {
                     "metric_name": metric_name,
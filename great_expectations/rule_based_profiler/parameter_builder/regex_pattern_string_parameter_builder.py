@@ -117,8 +117,6 @@ class RegexPatternStringParameterBuilder(ParameterBuilder):
 
         return: Tuple containing computed_parameter_value and parameter_computation_details metadata.
         """
-        metric_computation_result: MetricComputationResult
-
         metric_computation_result: MetricComputationResult = self.get_metrics(
             metric_name="column_values.nonnull.count",
             metric_domain_kwargs=self.metric_domain_kwargs,
@@ -128,12 +126,8 @@ class RegexPatternStringParameterBuilder(ParameterBuilder):
             parameters=parameters,
         )
 
-        metric_values: MetricValues
-
-        metric_values = metric_computation_result.metric_values
-
         # Now obtain 1-dimensional vector of values of computed metric (each element corresponds to a Batch ID).
-        metric_values = metric_values[:, 0]
+        metric_values: MetricValues = metric_computation_result.metric_values[:, 0]
 
         nonnull_count: int = sum(metric_values)
 
@@ -159,7 +153,7 @@ class RegexPatternStringParameterBuilder(ParameterBuilder):
         match_regex_metric_value_kwargs: dict
         for regex_string in candidate_regexes:
             if self.metric_value_kwargs:
-                match_regex_metric_value_kwargs: dict = {
+                match_regex_metric_value_kwargs = {
                     **self._metric_value_kwargs,
                     **{"regex": regex_string},
                 }
@@ -171,7 +165,7 @@ class RegexPatternStringParameterBuilder(ParameterBuilder):
             match_regex_metric_value_kwargs_list.append(match_regex_metric_value_kwargs)
 
         # Obtain resolved metrics and metadata for all metric configurations and available Batch objects simultaneously.
-        metric_computation_result: MetricComputationResult = self.get_metrics(
+        metric_computation_result = self.get_metrics(
             metric_name="column_values.match_regex.unexpected_count",
             metric_domain_kwargs=self.metric_domain_kwargs,
             metric_value_kwargs=match_regex_metric_value_kwargs_list,
@@ -1,15 +1,21 @@
 import logging
+import sys
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
+import numpy as np
+
+import great_expectations.exceptions as ge_exceptions
+from great_expectations.core import IDDict
 from great_expectations.core.batch import Batch, BatchRequest, RuntimeBatchRequest
 from great_expectations.rule_based_profiler.parameter_builder.parameter_builder import (
-    AttributedResolvedMetrics,
     MetricComputationResult,
     MetricValues,
     ParameterBuilder,
 )
 from great_expectations.rule_based_profiler.types import Domain, ParameterContainer
 from great_expectations.rule_based_profiler.util import (
+    NP_EPSILON,
+    build_metric_domain_kwargs,
     get_parameter_value_and_validate_return_type,
 )
 
@@ -21,65 +27,80 @@ class SimpleDateFormatStringParameterBuilder(ParameterBuilder):
     Detects the domain date format from a set of candidate date format strings by computing the
     column_values.match_strftime_format.unexpected_count metric for each candidate format and returning the format that
     has the lowest unexpected_count ratio.
+
+    Where the execution engine implements it, the fused column_values.match_strftime_format_multi.unexpected_counts
+    metric is used to compute unexpected counts for many candidate formats in a single pass over the data.
     """
 
-    CANDIDATE_STRINGS: Set[str] = {
-        "%Y-%m-%d",
-        "%m-%d-%Y",
-        "%y-%m-%d",
-        "%Y-%m-%dT%z",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y %b %d %H:%M:%S.%f %Z",
-        "%b %d %H:%M:%S %z %Y",
-        "%d/%b/%Y:%H:%M:%S %z",
-        "%b %d, %Y %H:%M:%S %p",
-        "%b %d %Y %H:%M:%S",
-        "%b %d %H:%M:%S %Y",
-        "%b %d %H:%M:%S %z",
-        "%b %d %H:%M:%S",
-        "%Y-%m-%d'T'%H:%M:%S%z",
-        "%Y-%m-%d'T'%H:%M:%S.%f'%z'",
-        "%Y-%m-%d %H:%M:%S %z",
-        "%Y-%m-%d %H:%M:%S%z",
-        "%Y-%m-%d %H:%M:%S,%f",
-        "%Y/%m/%d*%H:%M:%S",
-        "%Y %b %d %H:%M:%S.%f*%Z",
-        "%Y %b %d %H:%M:%S.%f",
-        "%Y-%m-%d %H:%M:%S,%f%z",
-        "%Y-%m-%d %H:%M:%S.%f",
-        "%Y-%m-%d %H:%M:%S.%f%z",
-        "%Y-%m-%d'T'%H:%M:%S.%f",
-        "%Y-%m-%d'T'%H:%M:%S",
-        "%Y-%m-%d'T'%H:%M:%S'%z'",
-        "%Y-%m-%d*%H:%M:%S:%f",
-        "%Y-%m-%d*%H:%M:%S",
-        "%y-%m-%d %H:%M:%S,%f %z",
-        "%y-%m-%d %H:%M:%S,%f",
-        "%y-%m-%d %H:%M:%S",
-        "%y/%m/%d %H:%M:%S",
-        "%y%m%d %H:%M:%S",
-        "%Y%m%d %H:%M:%S.%f",
-        "%m/%d/%y*%H:%M:%S",
-        "%m/%d/%Y*%H:%M:%S",
-        "%m/%d/%Y*%H:%M:%S*%f",
-        "%m/%d/%y %H:%M:%S %z",
-        "%m/%d/%Y %H:%M:%S %z",
-        "%H:%M:%S",
-        "%H:%M:%S.%f",
-        "%H:%M:%S,%f",
-        "%d/%b %H:%M:%S,%f",
-        "%d/%b/%Y:%H:%M:%S",
-        "%d/%b/%Y %H:%M:%S",
-        "%d-%b-%Y %H:%M:%S",
-        "%d-%b-%Y %H:%M:%S.%f",
-        "%d %b %Y %H:%M:%S",
-        "%d %b %Y %H:%M:%S*%f",
-        "%m%d_%H:%M:%S",
-        "%m%d_%H:%M:%S.%f",
-        "%m/%d/%Y %H:%M:%S %p:%f",
-        "%m/%d/%Y %H:%M:%S %p",
+    exclude_field_names: Set[str] = ParameterBuilder.exclude_field_names | {
+        "match_count_cache",
     }
 
+    # Candidate "strftime_format" strings, ordered by decreasing likelihood of occurrence (ISO-8601 formats come first).
+    # Strings are interned, so that hashing and comparing them (e.g., as dictionary keys) amounts to identity checks.
+    CANDIDATE_STRINGS: Tuple[str, ...] = tuple(
+        sys.intern(candidate_string)
+        for candidate_string in (
+            "%Y-%m-%d",
+            "%Y-%m-%d %H:%M:%S",
+            "%Y-%m-%d %H:%M:%S.%f",
+            "%Y-%m-%d %H:%M:%S%z",
+            "%Y-%m-%d %H:%M:%S %z",
+            "%Y-%m-%d %H:%M:%S.%f%z",
+            "%Y-%m-%d %H:%M:%S,%f",
+            "%Y-%m-%d %H:%M:%S,%f%z",
+            "%Y-%m-%dT%z",
+            "%Y-%m-%d'T'%H:%M:%S",
+            "%Y-%m-%d'T'%H:%M:%S.%f",
+            "%Y-%m-%d'T'%H:%M:%S%z",
+            "%Y-%m-%d'T'%H:%M:%S'%z'",
+            "%Y-%m-%d'T'%H:%M:%S.%f'%z'",
+            "%Y-%m-%d*%H:%M:%S",
+            "%Y-%m-%d*%H:%M:%S:%f",
+            "%m-%d-%Y",
+            "%y-%m-%d",
+            "%y-%m-%d %H:%M:%S",
+            "%y-%m-%d %H:%M:%S,%f",
+            "%y-%m-%d %H:%M:%S,%f %z",
+            "%Y/%m/%d*%H:%M:%S",
+            "%y/%m/%d %H:%M:%S",
+            "%y%m%d %H:%M:%S",
+            "%Y%m%d %H:%M:%S.%f",
+            "%m/%d/%Y %H:%M:%S %z",
+            "%m/%d/%y %H:%M:%S %z",
+            "%m/%d/%Y*%H:%M:%S",
+            "%m/%d/%y*%H:%M:%S",
+            "%m/%d/%Y*%H:%M:%S*%f",
+            "%H:%M:%S",
+            "%H:%M:%S.%f",
+            "%H:%M:%S,%f",
+            "%d/%b/%Y:%H:%M:%S %z",
+            "%d/%b/%Y:%H:%M:%S",
+            "%d/%b/%Y %H:%M:%S",
+            "%d-%b-%Y %H:%M:%S",
+            "%d-%b-%Y %H:%M:%S.%f",
+            "%d %b %Y %H:%M:%S",
+            "%d %b %Y %H:%M:%S*%f",
+            "%d/%b %H:%M:%S,%f",
+            "%b %d %Y %H:%M:%S",
+            "%b %d %H:%M:%S %Y",
+            "%b %d %H:%M:%S %z %Y",
+            "%b %d %H:%M:%S %z",
+            "%b %d %H:%M:%S",
+            "%Y %b %d %H:%M:%S.%f",
+            "%Y %b %d %H:%M:%S.%f %Z",
+            "%Y %b %d %H:%M:%S.%f*%Z",
+            "%m%d_%H:%M:%S",
+            "%m%d_%H:%M:%S.%f",
+            "%b %d, %Y %H:%M:%S %p",
+            "%m/%d/%Y %H:%M:%S %p",
+            "%m/%d/%Y %H:%M:%S %p:%f",
+        )
+    )
+
+    # Number of candidate "strftime_format" strings, whose metrics are computed as part of one "get_metrics()" call.
+    CANDIDATE_STRINGS_CHUNK_SIZE: int = 8
+
     def __init__(
         self,
         name: str,
@@ -87,6 +108,7 @@ class SimpleDateFormatStringParameterBuilder(ParameterBuilder):
         metric_value_kwargs: Optional[Union[str, dict]] = None,
         threshold: Union[float, str] = 1.0,
         candidate_strings: Optional[Union[Iterable[str], str]] = None,
+        enable_match_cache: bool = False,
         data_context: Optional["DataContext"] = None,  # noqa: F821
         batch_list: Optional[List[Batch]] = None,
         batch_request: Optional[Union[BatchRequest, RuntimeBatchRequest, dict]] = None,
@@ -100,7 +122,12 @@ class SimpleDateFormatStringParameterBuilder(ParameterBuilder):
             metric_domain_kwargs: used in MetricConfiguration
             metric_value_kwargs: used in MetricConfiguration
             threshold: the ratio of values that must match a format string for it to be accepted
-            candidate_strings: a list of candidate date format strings that will replace the default
+            candidate_strings: a list of candidate date format strings that will replace the default (or a single one)
+            enable_match_cache: if True, reuse unexpected counts, previously computed (per Batch, domain, and format)
+            by this instance; this only helps when same instance is used repeatedly (RuleBasedProfiler.run() recreates
+            ParameterBuilder objects for every run, and cache keys include domain).  Batch IDs do not reflect contents
+            of data (e.g., RuntimeBatchRequest with same batch identifiers may carry different data); hence, enable
+            only if data of given Batch ID does not change over lifetime of this instance (disabled by default).
             data_context: DataContext
             batch_list: explicitly passed Batch objects for parameter computation (take precedence over batch_request).
             batch_request: specified in ParameterBuilder configuration to get Batch objects for parameter computation.
@@ -117,8 +144,19 @@ class SimpleDateFormatStringParameterBuilder(ParameterBuilder):
 
         self._threshold = threshold
 
+        # Intern literal candidate strings (as CANDIDATE_STRINGS are); references (e.g., "$parameter.") are kept as is.
+        if isinstance(candidate_strings, (list, tuple, set, frozenset)):
+            candidate_strings = type(candidate_strings)(
+                sys.intern(candidate_string) for candidate_string in candidate_strings
+            )
+
         self._candidate_strings = candidate_strings
 
+        self._enable_match_cache = enable_match_cache
+
+        # Unexpected counts of "strftime_format" strings, keyed by (Batch ID, domain kwargs ID, "strftime_format").
+        self._match_count_cache: Dict[Tuple[str, str, str], int] = {}
+
     @property
     def fully_qualified_parameter_name(self) -> str:
         return f"$parameter.{self.name}"
@@ -146,9 +184,17 @@ class SimpleDateFormatStringParameterBuilder(ParameterBuilder):
     @property
     def candidate_strings(
         self,
-    ) -> Union[str, Union[List[str], Set[str]]]:
+    ) -> Optional[Union[str, Iterable[str]]]:
         return self._candidate_strings
 
+    @property
+    def enable_match_cache(self) -> bool:
+        return self._enable_match_cache
+
+    @property
+    def match_count_cache(self) -> Dict[Tuple[str, str, str], int]:
+        return self._match_count_cache
+
     def _build_parameters(
         self,
         parameter_container: ParameterContainer,
@@ -162,107 +208,438 @@ class SimpleDateFormatStringParameterBuilder(ParameterBuilder):
 
         return: Tuple containing computed_parameter_value and parameter_computation_details metadata.
         """
-        metric_computation_result: MetricComputationResult
-
-        metric_computation_result = self.get_metrics(
-            metric_name="column_values.nonnull.count",
-            metric_domain_kwargs=self.metric_domain_kwargs,
-            metric_value_kwargs=self.metric_value_kwargs,
+        # Obtain candidate_strings from "rule state" (i.e., variables and parameters); from instance variable otherwise.
+        candidate_strings: Optional[Iterable[str]] = self._resolve_parameter_reference(
             domain=domain,
+            parameter_reference=self.candidate_strings,
+            expected_return_type=None,
             variables=variables,
             parameters=parameters,
         )
+        if candidate_strings is None:
+            candidate_strings = SimpleDateFormatStringParameterBuilder.CANDIDATE_STRINGS
+        elif isinstance(candidate_strings, str):
+            # Single candidate string is not to be iterated over character by character.
+            candidate_strings = [candidate_strings]
 
-        metric_values: MetricValues
+        # Candidate strings are evaluated in the order given (most likely first); duplicates, if any, are dropped.
+        candidate_strings = list(dict.fromkeys(candidate_strings))
 
-        metric_values = metric_computation_result.metric_values
+        best_fmt_string: Optional[str] = None
+        best_ratio: float = 0.0
 
-        # Now obtain 1-dimensional vector of values of computed metric (each element corresponds to a Batch ID).
-        metric_values = metric_values[:, 0]
+        # Obtain threshold from "rule state" (i.e., variables and parameters); from instance variable otherwise.
+        threshold: float = self._resolve_parameter_reference(
+            domain=domain,
+            parameter_reference=self.threshold,
+            expected_return_type=float,
+            variables=variables,
+            parameters=parameters,
+        )
 
-        nonnull_count: int = sum(metric_values)
+        # Success ratio cannot exceed 1.0; hence, no candidate "strftime_format" string can satisfy larger threshold.
+        if threshold > 1.0:
+            return (
+                best_fmt_string,
+                {
+                    "success_ratio": best_ratio,
+                },
+            )
 
-        # Obtain candidate_strings from "rule state" (i.e., variables and parameters); from instance variable otherwise.
-        candidate_strings: Union[
-            List[str],
-            Set[str],
-        ] = get_parameter_value_and_validate_return_type(
+        # Candidate "strftime_format" strings are evaluated in chunks, ordered by likelihood of occurrence, so that
+        # metric computations for remaining candidates can be skipped, once perfect match (cannot be improved) exists.
+
+        # IDs of Batch objects and of metric domain (along with "strftime_format" string) identify unexpected counts.
+        # Batch IDs and Validator are obtained once (rather than for every chunk), since obtaining them loads Batches.
+        batch_ids: Optional[List[str]] = self.get_batch_ids(
             domain=domain,
-            parameter_reference=self.candidate_strings,
-            expected_return_type=None,
             variables=variables,
             parameters=parameters,
         )
-        if candidate_strings is not None and isinstance(candidate_strings, list):
-            candidate_strings = set(candidate_strings)
-        else:
-            candidate_strings = SimpleDateFormatStringParameterBuilder.CANDIDATE_STRINGS
+        if not batch_ids:
+            raise ge_exceptions.ProfilerExecutionError(
+                message=f"Utilizing a {self.__class__.__name__} requires a non-empty list of batch identifiers."
+            )
 
-        # Gather "metric_value_kwargs" for all candidate "strftime_format" strings.
+        # The Validator object used for metric calculation purposes.
+        validator: "Validator" = self.get_validator(  # noqa: F821
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        domain_kwargs_id: str = IDDict(
+            build_metric_domain_kwargs(
+                batch_id=None,
+                metric_domain_kwargs=self.metric_domain_kwargs,
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
+        ).to_id()
+
+        match_count_cache: Dict[Tuple[str, str, str], int] = (
+            self._match_count_cache if self.enable_match_cache else {}
+        )
+
+        # Non-null count is computed along with (i.e., in same dispatch to execution engine as) first chunk of metrics.
+        nonnull_count: Optional[int] = None
+
+        # Use fused multi-format metric, unless execution engine does not implement it (then, resort to per-format).
+        use_multi_format_metric: bool = True
+
+        # Unexpected counts (over all Batch objects) are accumulated in order of evaluation (aligned with candidates).
+        unexpected_counts: np.ndarray = np.empty(
+            shape=(len(candidate_strings),), dtype=np.int64
+        )
+        num_evaluated_candidate_strings: int = 0
+
+        chunk_start_idx: int
+        candidate_strings_chunk: List[str]
+        uncached_candidate_strings: List[str]
+        nonnull_count_metric_values: Optional[MetricValues]
+        match_strftime_unexpected_counts: np.ndarray
+        chunk_unexpected_counts: np.ndarray
         fmt_string: str
-        match_strftime_metric_value_kwargs_list: List[dict] = []
-        match_strftime_metric_value_kwargs: dict
-        for fmt_string in candidate_strings:
-            if self.metric_value_kwargs:
-                match_strftime_metric_value_kwargs = {
-                    **self.metric_value_kwargs,
-                    **{"strftime_format": fmt_string},
-                }
-            else:
-                match_strftime_metric_value_kwargs = {
-                    "strftime_format": fmt_string,
-                }
-
-            match_strftime_metric_value_kwargs_list.append(
-                match_strftime_metric_value_kwargs
+        batch_id: str
+        match_strftime_unexpected_count: int
+        best_idx: int
+        for chunk_start_idx in range(
+            0,
+            len(candidate_strings),
+            SimpleDateFormatStringParameterBuilder.CANDIDATE_STRINGS_CHUNK_SIZE,
+        ):
+            candidate_strings_chunk = candidate_strings[
+                chunk_start_idx : chunk_start_idx
+                + SimpleDateFormatStringParameterBuilder.CANDIDATE_STRINGS_CHUNK_SIZE
+            ]
+
+            # Metrics only need to be computed for candidate strings, whose unexpected counts are not already available.
+            uncached_candidate_strings = [
+                fmt_string
+                for fmt_string in candidate_strings_chunk
+                if any(
+                    (batch_id, domain_kwargs_id, fmt_string) not in match_count_cache
+                    for batch_id in batch_ids
+                )
+            ]
+
+            if uncached_candidate_strings or nonnull_count is None:
+                if use_multi_format_metric and uncached_candidate_strings:
+                    try:
+                        (
+                            nonnull_count_metric_values,
+                            match_strftime_unexpected_counts,
+                        ) = self._get_multi_format_unexpected_counts(
+                            candidate_strings=uncached_candidate_strings,
+                            include_nonnull_count=nonnull_count is None,
+                            batch_ids=batch_ids,
+                            validator=validator,
+                            domain=domain,
+                            variables=variables,
+                            parameters=parameters,
+                        )
+                    except ge_exceptions.MetricProviderError:
+                        use_multi_format_metric = False
+
+                if not (use_multi_format_metric and uncached_candidate_strings):
+                    (
+                        nonnull_count_metric_values,
+                        match_strftime_unexpected_counts,
+                    ) = self._get_single_format_unexpected_counts(
+                        candidate_strings=uncached_candidate_strings,
+                        include_nonnull_count=nonnull_count is None,
+                        batch_ids=batch_ids,
+                        validator=validator,
+                        domain=domain,
+                        variables=variables,
+                        parameters=parameters,
+                    )
+
+                if nonnull_count is None:
+                    nonnull_count = int(nonnull_count_metric_values.sum())
+
+                    # No values to match (e.g., column is empty); hence, remaining metric computations can be skipped.
+                    if nonnull_count <= 0:
+                        return (
+                            None,
+                            {
+                                "success_ratio": 0.0,
+                            },
+                        )
+
+                for fmt_string, unexpected_counts_per_batch in zip(
+                    uncached_candidate_strings, match_strftime_unexpected_counts
+                ):
+                    for batch_id, match_strftime_unexpected_count in zip(
+                        batch_ids, unexpected_counts_per_batch
+                    ):
+                        match_count_cache[
+                            (batch_id, domain_kwargs_id, fmt_string)
+                        ] = int(match_strftime_unexpected_count)
+
+            # Unexpected counts of chunk ("M x N", as computed) are totaled across Batch objects in one reduction.
+            chunk_unexpected_counts = np.array(
+                [
+                    [
+                        match_count_cache[(batch_id, domain_kwargs_id, fmt_string)]
+                        for batch_id in batch_ids
+                    ]
+                    for fmt_string in candidate_strings_chunk
+                ],
+                dtype=np.int64,
+            )
+            unexpected_counts[
+                chunk_start_idx : chunk_start_idx + len(candidate_strings_chunk)
+            ] = chunk_unexpected_counts.sum(axis=1)
+            num_evaluated_candidate_strings += len(candidate_strings_chunk)
+
+            best_idx, best_ratio = _pick_best_format(
+                unexpected_counts=unexpected_counts[
+                    chunk_start_idx:num_evaluated_candidate_strings
+                ],
+                nonnull_count=nonnull_count,
+                threshold=threshold,
             )
+            if best_ratio >= 1.0 - NP_EPSILON:
+                break
+
+        if num_evaluated_candidate_strings > 0:
+            best_idx, best_ratio = _pick_best_format(
+                unexpected_counts=unexpected_counts[:num_evaluated_candidate_strings],
+                nonnull_count=nonnull_count,
+                threshold=threshold,
+            )
+            best_fmt_string = candidate_strings[best_idx] if best_idx >= 0 else None
 
-        # Obtain resolved metrics and metadata for all metric configurations and available Batch objects simultaneously.
-        metric_computation_result: MetricComputationResult = self.get_metrics(
-            metric_name="column_values.match_strftime_format.unexpected_count",
+        return (
+            best_fmt_string,
+            {
+                "success_ratio": best_ratio,
+            },
+        )
+
+    @staticmethod
+    def _resolve_parameter_reference(
+        domain: Domain,
+        parameter_reference: Optional[Union[Any, str]],
+        expected_return_type: Optional[Union[type, tuple]] = None,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Optional[Any]:
+        """
+        Returns literal "parameter_reference" (already of "expected_return_type", if specified) as is; otherwise, defers
+        to "get_parameter_value_and_validate_return_type()" to resolve fully-qualified parameter names (also those
+        nested in dictionaries) against "rule state" (i.e., variables and parameters) and to validate return type.
+        """
+        if not (
+            isinstance(parameter_reference, dict)
+            or (
+                isinstance(parameter_reference, str)
+                and parameter_reference.startswith("$")
+            )
+        ) and (
+            expected_return_type is None
+            or isinstance(parameter_reference, expected_return_type)
+        ):
+            return parameter_reference
+
+        return get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=parameter_reference,
+            expected_return_type=expected_return_type,
+            variables=variables,
+            parameters=parameters,
+        )
+
+    def _get_metrics_with_nonnull_count(
+        self,
+        metric_specifications: List[Tuple[str, Union[dict, List[dict]]]],
+        include_nonnull_count: bool,
+        batch_ids: List[str],
+        validator: "Validator",  # noqa: F821
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Tuple[Optional[MetricValues], List[MetricComputationResult]]:
+        """
+        Computes metrics of "metric_specifications" and, if "include_nonnull_count" is set, also the
+        "column_values.nonnull.count" metric, in one dispatch to execution engine (rather than one dispatch for each).
+
+        return: Tuple containing non-null counts (one per Batch ID; None, unless "include_nonnull_count" is set) and
+        list of MetricComputationResult objects (in the same order as "metric_specifications"), whose metric values are
+        in the format "M x N x R^m" (see "return_matrix" directive of "get_metrics()").
+        """
+        if include_nonnull_count:
+            metric_specifications = [
+                (
+                    "column_values.nonnull.count",
+                    self.metric_value_kwargs,
+                ),
+            ] + metric_specifications
+
+        metric_computation_results: List[
+            MetricComputationResult
+        ] = self.get_multiple_metrics(
+            metric_specifications=metric_specifications,
             metric_domain_kwargs=self.metric_domain_kwargs,
-            metric_value_kwargs=match_strftime_metric_value_kwargs_list,
+            return_matrix=True,
+            batch_ids=batch_ids,
+            validator=validator,
             domain=domain,
             variables=variables,
             parameters=parameters,
         )
 
-        format_string_success_ratios: dict = {}
+        if not include_nonnull_count:
+            return None, metric_computation_results
 
-        attributed_resolved_metrics: AttributedResolvedMetrics
-        for attributed_resolved_metrics in metric_computation_result.metric_values:
-            # Now obtain 1-dimensional vector of values of computed metric (each element corresponds to a Batch ID).
-            metric_values = attributed_resolved_metrics.metric_values[:, 0]
+        # Now obtain 1-dimensional vector of values of computed metric (each element corresponds to a Batch ID).
+        nonnull_count_metric_values: MetricValues = metric_computation_results[
+            0
+        ].metric_values[0, :, 0]
 
-            match_strftime_unexpected_count: int = sum(metric_values)
-            success_ratio: float = (
-                nonnull_count - match_strftime_unexpected_count
-            ) / nonnull_count
-            format_string_success_ratios[
-                attributed_resolved_metrics.metric_attributes["strftime_format"]
-            ] = success_ratio
+        return nonnull_count_metric_values, metric_computation_results[1:]
 
-        best_fmt_string: Optional[str] = None
-        best_ratio: float = 0.0
+    def _get_multi_format_unexpected_counts(
+        self,
+        candidate_strings: List[str],
+        domain: Domain,
+        include_nonnull_count: bool = False,
+        batch_ids: Optional[List[str]] = None,
+        validator: Optional["Validator"] = None,  # noqa: F821
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Tuple[Optional[MetricValues], np.ndarray]:
+        """
+        Computes unexpected counts (for every available Batch object) for all "candidate_strings" in one pass over data,
+        using "column_values.match_strftime_format_multi.unexpected_counts" metric; raises MetricProviderError, if
+        execution engine does not implement this metric.
 
-        # Obtain threshold from "rule state" (i.e., variables and parameters); from instance variable otherwise.
-        threshold: float = get_parameter_value_and_validate_return_type(
+        return: Tuple containing non-null counts (see "_get_metrics_with_nonnull_count()") and unexpected counts in the
+        format "M x N", where "M" is the number of "candidate_strings" (in the same order) and "N" is the number of
+        Batch IDs.
+        """
+        match_strftime_multi_metric_value_kwargs: dict
+        if self.metric_value_kwargs:
+            match_strftime_multi_metric_value_kwargs = {
+                **self.metric_value_kwargs,
+                **{"strftime_formats": candidate_strings},
+            }
+        else:
+            match_strftime_multi_metric_value_kwargs = {
+                "strftime_formats": candidate_strings,
+            }
+
+        nonnull_count_metric_values: Optional[MetricValues]
+        metric_computation_results: List[MetricComputationResult]
+        (
+            nonnull_count_metric_values,
+            metric_computation_results,
+        ) = self._get_metrics_with_nonnull_count(
+            metric_specifications=[
+                (
+                    "column_values.match_strftime_format_multi.unexpected_counts",
+                    match_strftime_multi_metric_value_kwargs,
+                ),
+            ],
+            include_nonnull_count=include_nonnull_count,
+            batch_ids=batch_ids,
+            validator=validator,
             domain=domain,
-            parameter_reference=self.threshold,
-            expected_return_type=float,
             variables=variables,
             parameters=parameters,
         )
 
-        ratio: float
-        for fmt_string, ratio in format_string_success_ratios.items():
-            if ratio > best_ratio and ratio >= threshold:
-                best_fmt_string = fmt_string
-                best_ratio = ratio
+        # Metric values are in the format "1 x N x M" ("N" Batch IDs; "M" candidate strings); hence, transpose them.
+        metric_values: MetricValues = metric_computation_results[0].metric_values
+        return nonnull_count_metric_values, metric_values[0].T
 
-        return (
-            best_fmt_string,
-            {
-                "success_ratio": best_ratio,
-            },
+    def _get_single_format_unexpected_counts(
+        self,
+        candidate_strings: List[str],
+        domain: Domain,
+        include_nonnull_count: bool = False,
+        batch_ids: Optional[List[str]] = None,
+        validator: Optional["Validator"] = None,  # noqa: F821
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Tuple[Optional[MetricValues], np.ndarray]:
+        """
+        Computes unexpected counts (for every available Batch object) for all "candidate_strings", one pass over data
+        per candidate string, using "column_values.match_strftime_format.unexpected_count" metric.
+
+        return: Tuple containing non-null counts (see "_get_metrics_with_nonnull_count()") and unexpected counts in the
+        format "M x N", where "M" is the number of "candidate_strings" (in the same order) and "N" is the number of
+        Batch IDs.
+        """
+        # Base "metric_value_kwargs" are shared by all candidate "strftime_format" strings (hence, prepared only once).
+        base_metric_value_kwargs: dict = (
+            dict(self.metric_value_kwargs) if self.metric_value_kwargs else {}
         )
+
+        # Gather "metric_value_kwargs" for all candidate "strftime_format" strings.
+        fmt_string: str
+        match_strftime_metric_value_kwargs_list: List[dict] = [
+            {**base_metric_value_kwargs, "strftime_format": fmt_string}
+            for fmt_string in candidate_strings
+        ]
+
+        # Obtain resolved metrics and metadata for all metric configurations and available Batch objects simultaneously.
+        nonnull_count_metric_values: Optional[MetricValues]
+        metric_computation_results: List[MetricComputationResult]
+        (
+            nonnull_count_metric_values,
+            metric_computation_results,
+        ) = self._get_metrics_with_nonnull_count(
+            metric_specifications=[
+                (
+                    "column_values.match_strftime_format.unexpected_count",
+                    match_strftime_metric_value_kwargs_list,
+                ),
+            ]
+            if match_strftime_metric_value_kwargs_list
+            else [],
+            include_nonnull_count=include_nonnull_count,
+            batch_ids=batch_ids,
+            validator=validator,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        # Only non-null count could have been requested (all unexpected counts of interest are already available).
+        if not match_strftime_metric_value_kwargs_list:
+            return nonnull_count_metric_values, np.empty(
+                shape=(0, nonnull_count_metric_values.shape[0])
+            )
+
+        # Metric values are in the format "M x N x 1" ("M" candidate strings; "N" Batch IDs); drop scalar dimension.
+        metric_values: MetricValues = metric_computation_results[0].metric_values
+        return nonnull_count_metric_values, metric_values[:, :, 0]
+
+
+def _pick_best_format(
+    unexpected_counts: np.ndarray,
+    nonnull_count: int,
+    threshold: float,
+) -> Tuple[int, float]:
+    """
+    Selects best fit among candidate "strftime_format" strings, given their unexpected counts (over all Batch objects)
+    and the (positive) number of non-null values, in one vectorized pass (first occurrence of maximum wins ties, so
+    that more likely candidate strings are preferred).
+
+    return: Tuple containing index and success ratio of best fit; (-1, 0.0), if no candidate string attains positive
+    success ratio of at least "threshold" (candidate string matching no values at all is never the best fit).
+    """
+    if unexpected_counts.size == 0:
+        return -1, 0.0
+
+    success_ratios: np.ndarray = (nonnull_count - unexpected_counts) / nonnull_count
+
+    best_idx: int = int(np.argmax(success_ratios))
+    best_ratio: float = float(success_ratios[best_idx])
+    if best_ratio < threshold or best_ratio <= 0.0:
+        return -1, 0.0
+
+    return best_idx, best_ratio
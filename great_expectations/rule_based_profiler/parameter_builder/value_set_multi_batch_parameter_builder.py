@@ -152,6 +152,8 @@ def _get_unique_values_from_nested_collection_of_sets(
         Single flattened set containing unique values.
     """
 
-    flattened: List[Set[Any]] = list(itertools.chain.from_iterable(collection))
-    unique_values: Set[Any] = set().union(*flattened)
+    # Flatten both levels of nesting lazily, so that all values are added to the resulting set in a single pass.
+    unique_values: Set[Any] = set(
+        itertools.chain.from_iterable(itertools.chain.from_iterable(collection))
+    )
     return unique_values
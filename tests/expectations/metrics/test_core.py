@@ -15,6 +15,10 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyBatchData,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.expectations.metrics.column_map_metrics.column_values_match_strftime_format import (
+    get_strftime_format_regex,
+    is_parseable_by_strftime_format,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.self_check.util import (
     build_pandas_engine,
@@ -2949,6 +2953,111 @@ def test_distinct_metric_pd():
     assert results == {desired_metric.id: {1, 2, 3}}
 
 
+def test_match_strftime_format_multi_unexpected_counts_metric_pd():
+    engine = build_pandas_engine(
+        pd.DataFrame({"a": ["2021-01-01", "2021-01-02", None, "2021-01-03 10:00:00"]})
+    )
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column_values.match_strftime_format_multi.unexpected_counts",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "strftime_formats": ["%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%m-%d-%Y"]
+        },
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    metrics.update(results)
+    assert list(metrics[desired_metric.id]) == [1, 2, 3]
+    assert metrics[desired_metric.id].dtype == np.int64
+
+
+def test_match_strftime_format_multi_unexpected_counts_metric_invalid_format_pd():
+    engine = build_pandas_engine(
+        pd.DataFrame({"a": ["2021-01-01", "2021-01-02", None, "2021-01-03 10:00:00"]})
+    )
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column_values.match_strftime_format_multi.unexpected_counts",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"strftime_formats": ["%Y-%m-%d", "%Y%", "%Q"]},
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    metrics.update(results)
+    assert list(metrics[desired_metric.id]) == [1, 3, 3]
+
+
+@pytest.mark.parametrize(
+    "strftime_format",
+    [
+        "%",
+        "%Y%",
+        "%Q",
+    ],
+)
+def test_is_parseable_by_strftime_format_invalid_format(strftime_format):
+    format_regex = get_strftime_format_regex(strftime_format=strftime_format)
+    assert format_regex is None
+    assert not is_parseable_by_strftime_format(
+        val="2021", strftime_format=strftime_format, format_regex=format_regex
+    )
+
+
+def test_is_parseable_by_strftime_format_non_string_format():
+    assert get_strftime_format_regex(strftime_format=123) is None
+
+    with pytest.raises(TypeError) as e:
+        is_parseable_by_strftime_format(val="2021", strftime_format=123)
+
+    assert "must be of type string" in str(e.value)
+
+
+def test_is_parseable_by_strftime_format_anchors_match_at_end():
+    format_regex = get_strftime_format_regex(strftime_format="%Y-%m-%d")
+    assert format_regex is not None
+
+    # Regular expression matches prefix of value; however, entire value must conform to "strftime_format".
+    assert format_regex.match("2021-01-03 10:00:00") is not None
+    assert not is_parseable_by_strftime_format(
+        val="2021-01-03 10:00:00",
+        strftime_format="%Y-%m-%d",
+        format_regex=format_regex,
+    )
+    assert is_parseable_by_strftime_format(
+        val="2021-01-03", strftime_format="%Y-%m-%d", format_regex=format_regex
+    )
+    assert not is_parseable_by_strftime_format(
+        val="2021-13-03", strftime_format="%Y-%m-%d", format_regex=format_regex
+    )
+
+
 def test_batch_aggregate_metrics_pd():
     import datetime
 
@@ -0,0 +1,285 @@
+from typing import List, Optional, Tuple, Union
+from unittest import mock
+
+import numpy as np
+import pytest
+
+import great_expectations.exceptions as ge_exceptions
+
+from great_expectations.data_context import DataContext
+from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.rule_based_profiler.parameter_builder import (
+    MetricMultiBatchParameterBuilder,
+)
+from great_expectations.rule_based_profiler.parameter_builder.parameter_builder import (
+    MetricComputationResult,
+)
+from great_expectations.rule_based_profiler.types import Domain
+from great_expectations.validator.validator import Validator
+
+
+def test_get_multiple_metrics_matches_get_metrics_in_one_dispatch(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    metric_domain_kwargs: dict = {"column": "fare_amount"}
+
+    parameter_builder: MetricMultiBatchParameterBuilder = (
+        MetricMultiBatchParameterBuilder(
+            name="my_column_max",
+            metric_name="column.max",
+            metric_domain_kwargs=metric_domain_kwargs,
+            data_context=data_context,
+            batch_request=batch_request,
+        )
+    )
+
+    domain: Domain = Domain(
+        domain_type=MetricDomainTypes.COLUMN, domain_kwargs=metric_domain_kwargs
+    )
+
+    metric_specifications: List[Tuple[str, Optional[Union[dict, List[dict]]]]] = [
+        ("column.max", None),
+        (
+            "column_values.between.unexpected_count",
+            [
+                {"min_value": 0.0, "max_value": 10.0},
+                {"min_value": 10.0, "max_value": 50.0},
+            ],
+        ),
+        ("column.min", None),
+    ]
+
+    with mock.patch.object(
+        Validator,
+        "compute_metrics",
+        autospec=True,
+        side_effect=Validator.compute_metrics,
+    ) as mock_compute_metrics:
+        metric_computation_results: List[
+            MetricComputationResult
+        ] = parameter_builder.get_multiple_metrics(
+            metric_specifications=metric_specifications,
+            metric_domain_kwargs=metric_domain_kwargs,
+            domain=domain,
+        )
+
+    # All metrics (of all "metric_specifications") are resolved together.
+    assert mock_compute_metrics.call_count == 1
+    assert len(metric_computation_results) == len(metric_specifications)
+
+    metric_name: str
+    metric_value_kwargs: Optional[Union[dict, List[dict]]]
+    metric_computation_result: MetricComputationResult
+    expected_metric_computation_result: MetricComputationResult
+    for (metric_name, metric_value_kwargs), metric_computation_result in zip(
+        metric_specifications, metric_computation_results
+    ):
+        expected_metric_computation_result = parameter_builder.get_metrics(
+            metric_name=metric_name,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
+            domain=domain,
+        )
+
+        assert (
+            metric_computation_result.details
+            == expected_metric_computation_result.details
+        )
+
+        if isinstance(metric_value_kwargs, list):
+            # Resolved metrics are attributed to "metric_value_kwargs" (in the same order).
+            assert [
+                attributed_resolved_metrics.metric_attributes
+                for attributed_resolved_metrics in metric_computation_result.metric_values
+            ] == metric_value_kwargs
+            assert [
+                attributed_resolved_metrics.metric_attributes
+                for attributed_resolved_metrics in expected_metric_computation_result.metric_values
+            ] == metric_value_kwargs
+            for (
+                attributed_resolved_metrics,
+                expected_attributed_resolved_metrics,
+            ) in zip(
+                metric_computation_result.metric_values,
+                expected_metric_computation_result.metric_values,
+            ):
+                np.testing.assert_array_equal(
+                    attributed_resolved_metrics.metric_values,
+                    expected_attributed_resolved_metrics.metric_values,
+                )
+        else:
+            np.testing.assert_array_equal(
+                metric_computation_result.metric_values,
+                expected_metric_computation_result.metric_values,
+            )
+
+
+@pytest.mark.parametrize(
+    "metric_name,metric_value_kwargs,expected_metric_value_shape",
+    [
+        pytest.param(
+            "column_values.between.unexpected_count",
+            [
+                {"min_value": 0.0, "max_value": 10.0},
+                {"min_value": 10.0, "max_value": 50.0},
+                {"min_value": 50.0, "max_value": 100.0},
+            ],
+            (1,),
+            id="scalar_metric",
+        ),
+        pytest.param(
+            "column.quantile_values",
+            [
+                {"quantiles": [0.25, 0.5, 0.75], "allow_relative_error": "linear"},
+                {"quantiles": [0.1, 0.5, 0.9], "allow_relative_error": "linear"},
+            ],
+            (3,),
+            id="vector_metric",
+        ),
+    ],
+)
+def test_get_metrics_return_matrix(
+    metric_name,
+    metric_value_kwargs,
+    expected_metric_value_shape,
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    metric_domain_kwargs: dict = {"column": "fare_amount"}
+
+    parameter_builder: MetricMultiBatchParameterBuilder = (
+        MetricMultiBatchParameterBuilder(
+            name="my_column_metric",
+            metric_name=metric_name,
+            metric_domain_kwargs=metric_domain_kwargs,
+            data_context=data_context,
+            batch_request=batch_request,
+        )
+    )
+
+    domain: Domain = Domain(
+        domain_type=MetricDomainTypes.COLUMN, domain_kwargs=metric_domain_kwargs
+    )
+
+    num_batches: int = len(parameter_builder.get_batch_ids(domain=domain))
+
+    metric_computation_result: MetricComputationResult = parameter_builder.get_metrics(
+        metric_name=metric_name,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        return_matrix=True,
+        domain=domain,
+    )
+
+    # Metric values are returned in the format "M x N x R^m" (with "M" being the number of "metric_value_kwargs").
+    assert isinstance(metric_computation_result.metric_values, np.ndarray)
+    assert (
+        metric_computation_result.metric_values.shape
+        == (
+            len(metric_value_kwargs),
+            num_batches,
+        )
+        + expected_metric_value_shape
+    )
+
+    # Most significant dimension follows the order of "metric_value_kwargs".
+    value_kwargs: dict
+    metric_values: np.ndarray
+    for value_kwargs, metric_values in zip(
+        metric_value_kwargs, metric_computation_result.metric_values
+    ):
+        np.testing.assert_array_equal(
+            metric_values,
+            parameter_builder.get_metrics(
+                metric_name=metric_name,
+                metric_domain_kwargs=metric_domain_kwargs,
+                metric_value_kwargs=value_kwargs,
+                domain=domain,
+            ).metric_values,
+        )
+
+
+@pytest.mark.parametrize(
+    "metric_name,metric_value_kwargs,expected_error_message_substring",
+    [
+        pytest.param(
+            "column.quantile_values",
+            [
+                {"quantiles": [0.25, 0.5, 0.75], "allow_relative_error": "linear"},
+                {"quantiles": [0.1, 0.9], "allow_relative_error": "linear"},
+            ],
+            "to have values of the same shape",
+            id="different_shapes",
+        ),
+        pytest.param(
+            "column_values.between.unexpected_count",
+            [
+                {"min_value": 0.0, "max_value": 10.0},
+                {"min_value": 0.0, "max_value": 10.0},
+            ],
+            "requires distinct",
+            id="duplicate_metric_value_kwargs",
+        ),
+    ],
+)
+def test_get_metrics_return_matrix_error(
+    metric_name,
+    metric_value_kwargs,
+    expected_error_message_substring,
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    metric_domain_kwargs: dict = {"column": "fare_amount"}
+
+    parameter_builder: MetricMultiBatchParameterBuilder = (
+        MetricMultiBatchParameterBuilder(
+            name="my_column_metric",
+            metric_name=metric_name,
+            metric_domain_kwargs=metric_domain_kwargs,
+            data_context=data_context,
+            batch_request=batch_request,
+        )
+    )
+
+    domain: Domain = Domain(
+        domain_type=MetricDomainTypes.COLUMN, domain_kwargs=metric_domain_kwargs
+    )
+
+    with pytest.raises(ge_exceptions.ProfilerExecutionError) as e:
+        parameter_builder.get_metrics(
+            metric_name=metric_name,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
+            return_matrix=True,
+            domain=domain,
+        )
+
+    assert expected_error_message_substring in str(e.value)
@@ -1,75 +1,86 @@
-from typing import Set
+from typing import Dict, List, Tuple
+from unittest import mock
 
+import numpy as np
 import pytest
 
 import great_expectations.exceptions.exceptions as ge_exceptions
 from great_expectations.data_context import DataContext
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
 from great_expectations.rule_based_profiler.parameter_builder import (
+    ParameterBuilder,
     SimpleDateFormatStringParameterBuilder,
 )
+from great_expectations.rule_based_profiler.parameter_builder.simple_date_format_string_parameter_builder import (
+    _pick_best_format,
+)
 from great_expectations.rule_based_profiler.types import (
     Domain,
     ParameterContainer,
+    build_parameter_container,
+    build_parameter_container_for_variables,
     get_parameter_value_by_fully_qualified_parameter_name,
 )
+from great_expectations.rule_based_profiler.util import (
+    get_parameter_value_and_validate_return_type,
+)
 
-DEFAULT_CANDIDATE_STRINGS: Set[str] = {
+DEFAULT_CANDIDATE_STRINGS: Tuple[str, ...] = (
     "%Y-%m-%d",
     "%Y-%m-%d %H:%M:%S",
-    "%m-%d-%Y",
-    "%Y-%m-%dT%z",
-    "%y-%m-%d",
-    "%Y %b %d %H:%M:%S.%f %Z",
-    "%b %d %H:%M:%S %z %Y",
-    "%d/%b/%Y:%H:%M:%S %z",
-    "%b %d, %Y %H:%M:%S %p",
-    "%b %d %Y %H:%M:%S",
-    "%b %d %H:%M:%S %Y",
-    "%b %d %H:%M:%S %z",
-    "%b %d %H:%M:%S",
-    "%Y-%m-%d'T'%H:%M:%S%z",
-    "%Y-%m-%d'T'%H:%M:%S.%f'%z'",
-    "%Y-%m-%d %H:%M:%S %z",
+    "%Y-%m-%d %H:%M:%S.%f",
     "%Y-%m-%d %H:%M:%S%z",
+    "%Y-%m-%d %H:%M:%S %z",
+    "%Y-%m-%d %H:%M:%S.%f%z",
     "%Y-%m-%d %H:%M:%S,%f",
-    "%Y/%m/%d*%H:%M:%S",
-    "%Y %b %d %H:%M:%S.%f*%Z",
-    "%Y %b %d %H:%M:%S.%f",
     "%Y-%m-%d %H:%M:%S,%f%z",
-    "%Y-%m-%d %H:%M:%S.%f",
-    "%Y-%m-%d %H:%M:%S.%f%z",
-    "%Y-%m-%d'T'%H:%M:%S.%f",
+    "%Y-%m-%dT%z",
     "%Y-%m-%d'T'%H:%M:%S",
+    "%Y-%m-%d'T'%H:%M:%S.%f",
+    "%Y-%m-%d'T'%H:%M:%S%z",
     "%Y-%m-%d'T'%H:%M:%S'%z'",
-    "%Y-%m-%d*%H:%M:%S:%f",
+    "%Y-%m-%d'T'%H:%M:%S.%f'%z'",
     "%Y-%m-%d*%H:%M:%S",
-    "%y-%m-%d %H:%M:%S,%f %z",
-    "%y-%m-%d %H:%M:%S,%f",
+    "%Y-%m-%d*%H:%M:%S:%f",
+    "%m-%d-%Y",
+    "%y-%m-%d",
     "%y-%m-%d %H:%M:%S",
+    "%y-%m-%d %H:%M:%S,%f",
+    "%y-%m-%d %H:%M:%S,%f %z",
+    "%Y/%m/%d*%H:%M:%S",
     "%y/%m/%d %H:%M:%S",
     "%y%m%d %H:%M:%S",
     "%Y%m%d %H:%M:%S.%f",
-    "%m/%d/%y*%H:%M:%S",
+    "%m/%d/%Y %H:%M:%S %z",
+    "%m/%d/%y %H:%M:%S %z",
     "%m/%d/%Y*%H:%M:%S",
+    "%m/%d/%y*%H:%M:%S",
     "%m/%d/%Y*%H:%M:%S*%f",
-    "%m/%d/%y %H:%M:%S %z",
-    "%m/%d/%Y %H:%M:%S %z",
     "%H:%M:%S",
     "%H:%M:%S.%f",
     "%H:%M:%S,%f",
-    "%d/%b %H:%M:%S,%f",
+    "%d/%b/%Y:%H:%M:%S %z",
     "%d/%b/%Y:%H:%M:%S",
     "%d/%b/%Y %H:%M:%S",
     "%d-%b-%Y %H:%M:%S",
     "%d-%b-%Y %H:%M:%S.%f",
     "%d %b %Y %H:%M:%S",
     "%d %b %Y %H:%M:%S*%f",
+    "%d/%b %H:%M:%S,%f",
+    "%b %d %Y %H:%M:%S",
+    "%b %d %H:%M:%S %Y",
+    "%b %d %H:%M:%S %z %Y",
+    "%b %d %H:%M:%S %z",
+    "%b %d %H:%M:%S",
+    "%Y %b %d %H:%M:%S.%f",
+    "%Y %b %d %H:%M:%S.%f %Z",
+    "%Y %b %d %H:%M:%S.%f*%Z",
     "%m%d_%H:%M:%S",
     "%m%d_%H:%M:%S.%f",
-    "%m/%d/%Y %H:%M:%S %p:%f",
+    "%b %d, %Y %H:%M:%S %p",
     "%m/%d/%Y %H:%M:%S %p",
-}
+    "%m/%d/%Y %H:%M:%S %p:%f",
+)
 
 
 def test_simple_date_format_parameter_builder_instantiation():
@@ -82,6 +93,7 @@ def test_simple_date_format_parameter_builder_instantiation():
     assert date_format_string_parameter.CANDIDATE_STRINGS == DEFAULT_CANDIDATE_STRINGS
     assert date_format_string_parameter.threshold == 1.0
     assert date_format_string_parameter.candidate_strings is None
+    assert not date_format_string_parameter.enable_match_cache
 
 
 def test_simple_date_format_parameter_builder_zero_batch_id_error():
@@ -104,6 +116,91 @@ def test_simple_date_format_parameter_builder_zero_batch_id_error():
     )
 
 
+def test_simple_date_format_parameter_builder_resolve_parameter_reference():
+    domain: Domain = Domain(
+        domain_type=MetricDomainTypes.COLUMN, domain_kwargs={"column": "event_ts"}
+    )
+    variables: ParameterContainer = build_parameter_container_for_variables(
+        variables_configs={"my_threshold": 0.8}
+    )
+    parameter_container: ParameterContainer = ParameterContainer(parameter_nodes=None)
+    build_parameter_container(
+        parameter_container=parameter_container,
+        parameter_values={"$parameter.my_candidate_strings.value": ["%Y-%m-%d"]},
+    )
+    parameters: Dict[str, ParameterContainer] = {domain.id: parameter_container}
+
+    with mock.patch(
+        "great_expectations.rule_based_profiler.parameter_builder.simple_date_format_string_parameter_builder.get_parameter_value_and_validate_return_type",
+        wraps=get_parameter_value_and_validate_return_type,
+    ) as mock_get_parameter_value_and_validate_return_type:
+        # Literal values (of expected type) are returned as is, without invoking parameter resolution.
+        assert (
+            SimpleDateFormatStringParameterBuilder._resolve_parameter_reference(
+                domain=domain,
+                parameter_reference=0.9,
+                expected_return_type=float,
+                variables=variables,
+                parameters=parameters,
+            )
+            == 0.9
+        )
+        assert SimpleDateFormatStringParameterBuilder._resolve_parameter_reference(
+            domain=domain,
+            parameter_reference=["%Y-%m-%d %H:%M:%S"],
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        ) == ["%Y-%m-%d %H:%M:%S"]
+        assert not mock_get_parameter_value_and_validate_return_type.called
+
+        # References to "rule state" (i.e., variables and parameters) are resolved.
+        assert (
+            SimpleDateFormatStringParameterBuilder._resolve_parameter_reference(
+                domain=domain,
+                parameter_reference="$variables.my_threshold",
+                expected_return_type=float,
+                variables=variables,
+                parameters=parameters,
+            )
+            == 0.8
+        )
+        assert SimpleDateFormatStringParameterBuilder._resolve_parameter_reference(
+            domain=domain,
+            parameter_reference="$parameter.my_candidate_strings.value",
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        ) == ["%Y-%m-%d"]
+        assert mock_get_parameter_value_and_validate_return_type.call_count == 2
+
+        # Literal values of unexpected type are validated by parameter resolution.
+        with pytest.raises(ge_exceptions.ProfilerExecutionError):
+            SimpleDateFormatStringParameterBuilder._resolve_parameter_reference(
+                domain=domain,
+                parameter_reference=1,
+                expected_return_type=float,
+                variables=variables,
+                parameters=parameters,
+            )
+        assert mock_get_parameter_value_and_validate_return_type.call_count == 3
+
+
+def test_pick_best_format_success_ratio_at_threshold():
+    # Success ratio of 4 matching values out of 10 is exactly 0.4; hence, it satisfies threshold of 0.4.
+    assert _pick_best_format(
+        unexpected_counts=np.array([6]), nonnull_count=10, threshold=0.4
+    ) == (0, 0.4)
+
+    assert _pick_best_format(
+        unexpected_counts=np.array([8, 6, 7]), nonnull_count=9, threshold=0.0
+    ) == (1, 3 / 9)
+
+    assert _pick_best_format(
+        unexpected_counts=np.array([7]), nonnull_count=10, threshold=0.4
+    ) == (-1, 0.0)
+
+
 def test_simple_date_format_parameter_builder_alice(
     alice_columnar_table_single_batch_context,
 ):
@@ -160,6 +257,395 @@ def test_simple_date_format_parameter_builder_alice(
     )
 
 
+def test_simple_date_format_parameter_builder_alice_loads_batches_once(
+    alice_columnar_table_single_batch_context,
+):
+    data_context: DataContext = alice_columnar_table_single_batch_context
+
+    batch_request: dict = {
+        "datasource_name": "alice_columnar_table_single_batch_datasource",
+        "data_connector_name": "alice_columnar_table_single_batch_data_connector",
+        "data_asset_name": "alice_columnar_table_single_batch_data_asset",
+    }
+
+    metric_domain_kwargs = {"column": "event_ts"}
+
+    # None of these candidate strings matches all values; hence, every chunk of candidate strings is evaluated.
+    candidate_strings: Tuple[str, ...] = DEFAULT_CANDIDATE_STRINGS[16:]
+
+    date_format_string_parameter: SimpleDateFormatStringParameterBuilder = (
+        SimpleDateFormatStringParameterBuilder(
+            name="my_date_format",
+            metric_domain_kwargs=metric_domain_kwargs,
+            candidate_strings=candidate_strings,
+            data_context=data_context,
+            batch_request=batch_request,
+        )
+    )
+
+    parameter_container: ParameterContainer = ParameterContainer(parameter_nodes=None)
+    domain: Domain = Domain(
+        domain_type=MetricDomainTypes.COLUMN, domain_kwargs=metric_domain_kwargs
+    )
+
+    with mock.patch.object(
+        SimpleDateFormatStringParameterBuilder,
+        "get_batch_ids",
+        autospec=True,
+        side_effect=ParameterBuilder.get_batch_ids,
+    ) as mock_get_batch_ids, mock.patch.object(
+        SimpleDateFormatStringParameterBuilder,
+        "get_validator",
+        autospec=True,
+        side_effect=ParameterBuilder.get_validator,
+    ) as mock_get_validator, mock.patch.object(
+        SimpleDateFormatStringParameterBuilder,
+        "get_multiple_metrics",
+        autospec=True,
+        side_effect=ParameterBuilder.get_multiple_metrics,
+    ) as mock_get_multiple_metrics:
+        date_format_string_parameter.build_parameters(
+            parameter_container=parameter_container, domain=domain
+        )
+
+    assert mock_get_multiple_metrics.call_count == len(
+        range(
+            0,
+            len(candidate_strings),
+            SimpleDateFormatStringParameterBuilder.CANDIDATE_STRINGS_CHUNK_SIZE,
+        )
+    )
+    assert mock_get_batch_ids.call_count == 1
+    assert mock_get_validator.call_count == 1
+
+
+def test_simple_date_format_parameter_builder_alice_skips_remaining_chunks(
+    alice_columnar_table_single_batch_context,
+):
+    data_context: DataContext = alice_columnar_table_single_batch_context
+
+    batch_request: dict = {
+        "datasource_name": "alice_columnar_table_single_batch_datasource",
+        "data_connector_name": "alice_columnar_table_single_batch_data_connector",
+        "data_asset_name": "alice_columnar_table_single_batch_data_asset",
+    }
+
+    metric_domain_kwargs = {"column": "event_ts"}
+
+    date_format_string_parameter: SimpleDateFormatStringParameterBuilder = (
+        SimpleDateFormatStringParameterBuilder(
+            name="my_date_format",
+            metric_domain_kwargs=metric_domain_kwargs,
+            data_context=data_context,
+            batch_request=batch_request,
+        )
+    )
+
+    # Perfect match ("%Y-%m-%d %H:%M:%S") is among first chunk of candidate strings.
+    assert (
+        DEFAULT_CANDIDATE_STRINGS.index("%Y-%m-%d %H:%M:%S")
+        < SimpleDateFormatStringParameterBuilder.CANDIDATE_STRINGS_CHUNK_SIZE
+    )
+
+    parameter_container: ParameterContainer = ParameterContainer(parameter_nodes=None)
+    domain: Domain = Domain(
+        domain_type=MetricDomainTypes.COLUMN, domain_kwargs=metric_domain_kwargs
+    )
+
+    with mock.patch.object(
+        SimpleDateFormatStringParameterBuilder,
+        "get_multiple_metrics",
+        autospec=True,
+        side_effect=ParameterBuilder.get_multiple_metrics,
+    ) as mock_get_multiple_metrics:
+        assert date_format_string_parameter._build_parameters(
+            parameter_container=parameter_container, domain=domain
+        ) == ("%Y-%m-%d %H:%M:%S", {"success_ratio": 1.0})
+
+    # Metrics for remaining chunks of candidate strings are not computed, once perfect match is found.
+    assert mock_get_multiple_metrics.call_count == 1
+
+
+def test_simple_date_format_parameter_builder_alice_single_format_fallback(
+    alice_columnar_table_single_batch_context,
+):
+    data_context: DataContext = alice_columnar_table_single_batch_context
+
+    batch_request: dict = {
+        "datasource_name": "alice_columnar_table_single_batch_datasource",
+        "data_connector_name": "alice_columnar_table_single_batch_data_connector",
+        "data_asset_name": "alice_columnar_table_single_batch_data_asset",
+    }
+
+    metric_domain_kwargs = {"column": "event_ts"}
+
+    # Perfect match ("%Y-%m-%d %H:%M:%S") is in second chunk of candidate strings; hence, both chunks are evaluated.
+    candidate_strings: Tuple[str, ...] = DEFAULT_CANDIDATE_STRINGS[
+        2 : 2 + SimpleDateFormatStringParameterBuilder.CANDIDATE_STRINGS_CHUNK_SIZE
+    ] + ("%Y-%m-%d %H:%M:%S",)
+
+    date_format_string_parameter: SimpleDateFormatStringParameterBuilder = (
+        SimpleDateFormatStringParameterBuilder(
+            name="my_date_format",
+            metric_domain_kwargs=metric_domain_kwargs,
+            candidate_strings=candidate_strings,
+            data_context=data_context,
+            batch_request=batch_request,
+        )
+    )
+
+    domain: Domain = Domain(
+        domain_type=MetricDomainTypes.COLUMN, domain_kwargs=metric_domain_kwargs
+    )
+
+    expected_parameters: Tuple[
+        str, dict
+    ] = date_format_string_parameter._build_parameters(
+        parameter_container=ParameterContainer(parameter_nodes=None), domain=domain
+    )
+    assert expected_parameters == ("%Y-%m-%d %H:%M:%S", {"success_ratio": 1.0})
+
+    # Execution engines, not implementing fused multi-format metric, raise MetricProviderError upon its dispatch.
+    def get_multiple_metrics_without_multi_format_metric(
+        parameter_builder: ParameterBuilder, *args, **kwargs
+    ):
+        if any(
+            metric_name == "column_values.match_strftime_format_multi.unexpected_counts"
+            for metric_name, _ in kwargs["metric_specifications"]
+        ):
+            raise ge_exceptions.MetricProviderError(
+                "No provider found for column_values.match_strftime_format_multi.unexpected_counts"
+            )
+
+        return ParameterBuilder.get_multiple_metrics(parameter_builder, *args, **kwargs)
+
+    with mock.patch.object(
+        SimpleDateFormatStringParameterBuilder,
+        "get_multiple_metrics",
+        autospec=True,
+        side_effect=get_multiple_metrics_without_multi_format_metric,
+    ) as mock_get_multiple_metrics, mock.patch.object(
+        SimpleDateFormatStringParameterBuilder,
+        "_get_single_format_unexpected_counts",
+        autospec=True,
+        side_effect=SimpleDateFormatStringParameterBuilder._get_single_format_unexpected_counts,
+    ) as mock_get_single_format_unexpected_counts:
+        assert (
+            date_format_string_parameter._build_parameters(
+                parameter_container=ParameterContainer(parameter_nodes=None),
+                domain=domain,
+            )
+            == expected_parameters
+        )
+
+    num_chunks: int = len(
+        range(
+            0,
+            len(candidate_strings),
+            SimpleDateFormatStringParameterBuilder.CANDIDATE_STRINGS_CHUNK_SIZE,
+        )
+    )
+    assert num_chunks == 2
+
+    # Fused multi-format metric is only attempted once; thereafter, every chunk is dispatched once per-format.
+    assert mock_get_single_format_unexpected_counts.call_count == num_chunks
+    assert mock_get_multiple_metrics.call_count == 1 + num_chunks
+
+    # Each candidate string of chunk is requested (in the same order) with its own "metric_value_kwargs".
+    chunk_start_idx: int
+    for chunk_start_idx, call in zip(
+        range(
+            0,
+            len(candidate_strings),
+            SimpleDateFormatStringParameterBuilder.CANDIDATE_STRINGS_CHUNK_SIZE,
+        ),
+        mock_get_multiple_metrics.call_args_list[1:],
+    ):
+        assert call.kwargs["metric_specifications"][-1] == (
+            "column_values.match_strftime_format.unexpected_count",
+            [
+                {"strftime_format": fmt_string}
+                for fmt_string in candidate_strings[
+                    chunk_start_idx : chunk_start_idx
+                    + SimpleDateFormatStringParameterBuilder.CANDIDATE_STRINGS_CHUNK_SIZE
+                ]
+            ],
+        )
+
+
+def test_simple_date_format_parameter_builder_alice_single_candidate_string(
+    alice_columnar_table_single_batch_context,
+):
+    data_context: DataContext = alice_columnar_table_single_batch_context
+
+    batch_request: dict = {
+        "datasource_name": "alice_columnar_table_single_batch_datasource",
+        "data_connector_name": "alice_columnar_table_single_batch_data_connector",
+        "data_asset_name": "alice_columnar_table_single_batch_data_asset",
+    }
+
+    metric_domain_kwargs = {"column": "event_ts"}
+
+    date_format_string_parameter: SimpleDateFormatStringParameterBuilder = (
+        SimpleDateFormatStringParameterBuilder(
+            name="my_date_format",
+            metric_domain_kwargs=metric_domain_kwargs,
+            candidate_strings="%Y-%m-%d %H:%M:%S",
+            data_context=data_context,
+            batch_request=batch_request,
+        )
+    )
+
+    parameter_container: ParameterContainer = ParameterContainer(parameter_nodes=None)
+    domain: Domain = Domain(
+        domain_type=MetricDomainTypes.COLUMN, domain_kwargs=metric_domain_kwargs
+    )
+
+    with mock.patch.object(
+        SimpleDateFormatStringParameterBuilder,
+        "get_multiple_metrics",
+        autospec=True,
+        side_effect=ParameterBuilder.get_multiple_metrics,
+    ) as mock_get_multiple_metrics:
+        assert date_format_string_parameter._build_parameters(
+            parameter_container=parameter_container, domain=domain
+        ) == ("%Y-%m-%d %H:%M:%S", {"success_ratio": 1.0})
+
+    # Single candidate string is evaluated as a whole (rather than character by character).
+    assert mock_get_multiple_metrics.call_count == 1
+    assert mock_get_multiple_metrics.call_args.kwargs["metric_specifications"][-1] == (
+        "column_values.match_strftime_format_multi.unexpected_counts",
+        {"strftime_formats": ["%Y-%m-%d %H:%M:%S"]},
+    )
+
+
+def test_simple_date_format_parameter_builder_alice_match_count_cache(
+    alice_columnar_table_single_batch_context,
+):
+    data_context: DataContext = alice_columnar_table_single_batch_context
+
+    batch_request: dict = {
+        "datasource_name": "alice_columnar_table_single_batch_datasource",
+        "data_connector_name": "alice_columnar_table_single_batch_data_connector",
+        "data_asset_name": "alice_columnar_table_single_batch_data_asset",
+    }
+
+    metric_domain_kwargs = {"column": "event_ts"}
+
+    date_format_string_parameter: SimpleDateFormatStringParameterBuilder = (
+        SimpleDateFormatStringParameterBuilder(
+            name="my_date_format",
+            metric_domain_kwargs=metric_domain_kwargs,
+            enable_match_cache=True,
+            data_context=data_context,
+            batch_request=batch_request,
+        )
+    )
+
+    assert date_format_string_parameter.enable_match_cache
+    assert date_format_string_parameter.match_count_cache == {}
+
+    domain: Domain = Domain(
+        domain_type=MetricDomainTypes.COLUMN, domain_kwargs=metric_domain_kwargs
+    )
+
+    fully_qualified_parameter_name_for_value: str = "$parameter.my_date_format"
+    expected_value: dict = {
+        "value": "%Y-%m-%d %H:%M:%S",
+        "details": {"success_ratio": 1.0},
+    }
+
+    parameter_container: ParameterContainer
+    requested_metric_names: List[List[str]] = []
+    for _ in range(2):
+        parameter_container = ParameterContainer(parameter_nodes=None)
+        with mock.patch.object(
+            SimpleDateFormatStringParameterBuilder,
+            "get_multiple_metrics",
+            autospec=True,
+            side_effect=ParameterBuilder.get_multiple_metrics,
+        ) as mock_get_multiple_metrics:
+            date_format_string_parameter.build_parameters(
+                parameter_container=parameter_container, domain=domain
+            )
+
+        assert (
+            get_parameter_value_by_fully_qualified_parameter_name(
+                fully_qualified_parameter_name=fully_qualified_parameter_name_for_value,
+                domain=domain,
+                parameters={domain.id: parameter_container},
+            )
+            == expected_value
+        )
+
+        requested_metric_names.append(
+            [
+                metric_name
+                for call in mock_get_multiple_metrics.call_args_list
+                for metric_name, _ in call.kwargs["metric_specifications"]
+            ]
+        )
+
+    assert any(
+        metric_name.startswith("column_values.match_strftime_format")
+        for metric_name in requested_metric_names[0]
+    )
+
+    # Repeated computation is served from cache; hence, only non-null count is requested.
+    assert requested_metric_names[1] == ["column_values.nonnull.count"]
+
+    assert "%Y-%m-%d %H:%M:%S" in {
+        fmt_string
+        for (_, _, fmt_string) in date_format_string_parameter.match_count_cache.keys()
+    }
+
+
+def test_simple_date_format_parameter_builder_alice_no_nonnull_values(
+    alice_columnar_table_single_batch_context,
+):
+    data_context: DataContext = alice_columnar_table_single_batch_context
+
+    batch_request: dict = {
+        "datasource_name": "alice_columnar_table_single_batch_datasource",
+        "data_connector_name": "alice_columnar_table_single_batch_data_connector",
+        "data_asset_name": "alice_columnar_table_single_batch_data_asset",
+    }
+
+    # None of the rows satisfies the row condition; hence, the column domain contains no non-null values.
+    metric_domain_kwargs = {
+        "column": "event_ts",
+        "row_condition": "event_type<0",
+        "condition_parser": "pandas",
+    }
+
+    date_format_string_parameter: SimpleDateFormatStringParameterBuilder = (
+        SimpleDateFormatStringParameterBuilder(
+            name="my_date_format",
+            metric_domain_kwargs=metric_domain_kwargs,
+            data_context=data_context,
+            batch_request=batch_request,
+        )
+    )
+
+    parameter_container: ParameterContainer = ParameterContainer(parameter_nodes=None)
+    domain: Domain = Domain(
+        domain_type=MetricDomainTypes.COLUMN, domain_kwargs=metric_domain_kwargs
+    )
+
+    with mock.patch.object(
+        SimpleDateFormatStringParameterBuilder,
+        "get_multiple_metrics",
+        autospec=True,
+        side_effect=ParameterBuilder.get_multiple_metrics,
+    ) as mock_get_multiple_metrics:
+        assert date_format_string_parameter._build_parameters(
+            parameter_container=parameter_container, domain=domain
+        ) == (None, {"success_ratio": 0.0})
+
+    # Metrics for remaining chunks of candidate strings are not computed, once non-null count is known to be zero.
+    assert mock_get_multiple_metrics.call_count == 1
+
+
 def test_simple_date_format_parameter_builder_bobby(
     bobby_columnar_table_multi_batch_deterministic_data_context,
 ):